@@ -1,5 +1,129 @@
 import datetime
-import pytz
+import glob
+import os
+import pickle
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+
+_EPOCH_ORD = datetime.date(1970, 1, 1).toordinal()
+
+# Timezone whose holidays get_business_days excludes
+BUSINESS_DAYS_TZ = "US/Eastern"
+
+# REM_WE[start_wd][rem]: weekend days among `rem` consecutive days starting on weekday `start_wd`
+REM_WE = [
+    [sum(1 for i in range(rem) if (start_wd + i) % 7 >= 5) for rem in range(7)]
+    for start_wd in range(7)
+]
+
+# Day-of-week lookup over the 48-month cycle starting 1901-01-01 (a Tuesday). Every 4-year block
+# between 1901 and 2099 has the same month lengths, so one table covers that whole range.
+_CYCLE_START_YEAR = 1901
+_CYCLE_START_WEEKDAY = 1
+_CYCLE_START_ORD = datetime.date(_CYCLE_START_YEAR, 1, 1).toordinal()
+DIM_48 = [
+    (datetime.date(_CYCLE_START_YEAR + (i + 1) // 12, (i + 1) % 12 + 1, 1)
+     - datetime.date(_CYCLE_START_YEAR + i // 12, i % 12 + 1, 1)).days
+    for i in range(48)
+]
+DBM_48 = [sum(DIM_48[:i]) for i in range(48)]
+
+
+def _day_number(
+        year : int, 
+        month : int, 
+        day : int
+        ) -> int:
+    """
+    Returns the number of days from 1901-01-01 to the given date using the 48-month tables.
+    Years outside 1901-2099 fall back to datetime.date.
+    :param year: Year of the date
+    :type year: int
+    :param month: Month of the date
+    :type month: int
+    :param day: Day of the month
+    :type day: int
+    :return: Days since 1901-01-01
+    :rtype: int
+    """
+    if not 1901 <= year <= 2099:
+        return datetime.date(year, month, day).toordinal() - _CYCLE_START_ORD
+    cycle, year_in_cycle = divmod(year - _CYCLE_START_YEAR, 4)
+    month_index = year_in_cycle * 12 + month - 1
+    if not 1 <= month <= 12 or not 1 <= day <= DIM_48[month_index]:
+        raise ValueError(f"invalid date: {year:04d}-{month:02d}-{day:02d}")
+    return cycle * 1461 + DBM_48[month_index] + day - 1
+
+
+def _as_date(value):
+    """
+    Returns the calendar date of a datetime; dates and (year, month, day) tuples pass through unchanged.
+    :param value: The value to convert
+    :type value: datetime.datetime, datetime.date or tuple
+    :return: The value at day granularity
+    """
+    return value.date() if isinstance(value, datetime.datetime) else value
+
+
+def _parse_holiday_line(
+        line : str
+        ) -> tuple:
+    """
+    Parses one data line of the holidays file. Only the first two ', ' separators split fields,
+    so a holiday name may itself contain ', '.
+    :param line: A line of the holidays file, after the header
+    :type line: str
+    :return: The (timezone, date, holiday) fields of the line
+    :rtype: tuple
+    """
+    timezone, date_str, holiday = line.strip().split(', ', 2)
+    if len(date_str) != 8 or not date_str.isdigit():
+        raise ValueError(f"time data {date_str!r} does not match format '%Y%m%d'")
+    date = datetime.date(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
+    return timezone, date, holiday
+
+
+@lru_cache(maxsize=64)
+def _tz(name : str):
+    """
+    Returns the ZoneInfo timezone for the given name, cached across calls.
+    :param name: Timezone name
+    :type name: str
+    :return: The timezone object
+    """
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=8192)
+def _convert(
+        from_date : datetime.datetime, 
+        from_date_TZ : str, 
+        to_date_TZ : str
+        ) -> datetime.datetime:
+    """
+    Converts a naive datetime from one timezone to another, memoized for repeated inputs.
+    The input's fold is ignored, since equal naive datetimes share a cache entry whatever their fold.
+    :param from_date: The datetime to convert
+    :type from_date: datetime.datetime
+    :param from_date_TZ: Timezone of the source datetime
+    :type from_date_TZ: str
+    :param to_date_TZ: Timezone of the target datetime
+    :type to_date_TZ: str
+    :return: The converted datetime in the target timezone
+    :rtype: datetime.datetime
+    """
+    if from_date.tzinfo is not None:
+        raise ValueError("Not naive datetime (tzinfo is already set)")
+    from_date = from_date.replace(tzinfo=_tz(from_date_TZ), fold=0)
+    later = from_date.replace(fold=1)
+    # Like pytz's localize(), read a repeated wall time as standard time, else as its later occurrence
+    if from_date.utcoffset() > later.utcoffset() and not (later.dst() and not from_date.dst()):
+        from_date = later
+    return from_date.astimezone(_tz(to_date_TZ))
 
 
 class DateUtility:
@@ -12,7 +136,77 @@ class DateUtility:
         :param holidays_file: Path to the holidays data file
         :type holidays_file: str
         """
-        self.holidays = self.load_holidays(holidays_file)
+        self.holidays_file = holidays_file
+        self._holiday_names = None  # Loaded on first use of name_of / holidays
+        self._index_holidays(self.load_cached_holidays(holidays_file))
+
+
+    def _index_holidays(
+            self, 
+            holiday_ord_set : dict
+            ):
+        """
+        Builds the lookup structures used by is_holiday and get_business_days from holiday ordinals.
+        :param holiday_ord_set: Dictionary mapping each timezone to a frozenset of holiday date ordinals
+        :type holiday_ord_set: dict
+        """
+        # Holiday ordinals per timezone; membership is all is_holiday and get_business_days need
+        self._holiday_ord_set = holiday_ord_set
+        # Sorted int32 ordinals of the holidays falling on weekdays, per timezone, for range counts
+        self.holiday_ordinals = {
+            timezone: array('i', sorted(o for o in ordinals if datetime.date.fromordinal(o).weekday() < 5))
+            for timezone, ordinals in holiday_ord_set.items()
+        }
+        self._business_holiday_ordinals = self.holiday_ordinals.get(BUSINESS_DAYS_TZ, array('i'))
+
+
+    @property
+    def holidays(self) -> dict:
+        """
+        Holiday names keyed by timezone and date, read from the holidays file on first access.
+        :return: Dictionary containing holidays data
+        :rtype: dict
+        """
+        if self._holiday_names is None:
+            self._holiday_names = self.load_holidays(self.holidays_file)
+        return self._holiday_names
+
+
+    @holidays.setter
+    def holidays(
+            self, 
+            holidays : dict
+            ):
+        """
+        Replaces the holidays data; is_holiday, get_business_days and name_of all follow the new dictionary.
+        :param holidays: Dictionary containing holidays data
+        :type holidays: dict
+        """
+        self._holiday_names = holidays
+        self._index_holidays({
+            timezone: frozenset(date.toordinal() for date in dates)
+            for timezone, dates in holidays.items()
+        })
+
+
+    def name_of(
+            self, 
+            timezone : str, 
+            date : datetime.datetime
+            ):
+        """
+        Returns the name of the holiday on the specified date in the given timezone.
+        :param timezone: The timezone to consider for holidays
+        :type timezone: str
+        :param date: The date to look up
+        :type date: datetime.datetime
+        :return: The holiday name, or None if the date is not a holiday
+        :rtype: str or None
+        """
+        if not self.is_holiday(date, timezone):
+            return None
+        # Names are read later than the ordinals, so the file may have changed in between
+        return self.holidays.get(timezone, {}).get(_as_date(date))
 
 
     def load_holidays(
@@ -28,16 +222,82 @@ class DateUtility:
         """
         holidays = {}
         with open(holidays_file, 'r') as file:
-            lines = file.readlines()[1:]  # Exclude header line
-            for line in lines:
-                timezone, date_str, holiday = line.strip().split(', ')
-                date = datetime.datetime.strptime(date_str, "%Y%m%d").date()
+            next(file, None)  # Exclude header line
+            for line in file:
+                timezone, date, holiday = _parse_holiday_line(line)
                 if timezone not in holidays:
                     holidays[timezone] = {}
                 holidays[timezone][date] = holiday
         return holidays
 
 
+    def load_holiday_ordinals(
+            self, 
+            holidays_file : str
+            ) -> dict:
+        """
+        Loads only the holiday dates from the specified file, skipping the holiday names.
+        :param holidays_file: Path to the holidays data file
+        :type holidays_file: str
+        :return: Dictionary mapping each timezone to a frozenset of holiday date ordinals
+        :rtype: dict
+        """
+        ordinals = {}
+        with open(holidays_file, 'r') as file:
+            next(file, None)  # Exclude header line
+            for line in file:
+                timezone, date, _ = _parse_holiday_line(line)
+                ordinals.setdefault(timezone, set()).add(date.toordinal())
+        return {timezone: frozenset(dates) for timezone, dates in ordinals.items()}
+
+
+    def load_cached_holidays(
+            self, 
+            holidays_file : str
+            ) -> dict:
+        """
+        Loads holiday ordinals through a pickle cache stored next to the holidays file.
+        The cache file name encodes the file's mtime and size, so editing the file invalidates it.
+        :param holidays_file: Path to the holidays data file
+        :type holidays_file: str
+        :return: Dictionary mapping each timezone to a frozenset of holiday date ordinals
+        :rtype: dict
+        """
+        st = os.stat(holidays_file)
+        cache_file = f"{holidays_file}.{st.st_mtime_ns}.{st.st_size}.ordinals.pkl"
+        try:
+            with open(cache_file, 'rb') as file:
+                cached = pickle.load(file)
+        except Exception:  # Missing, truncated or otherwise unreadable cache: parse the file instead
+            cached = None
+        if isinstance(cached, dict) and all(
+            isinstance(timezone, str) and isinstance(ordinals, frozenset)
+            for timezone, ordinals in cached.items()
+        ):
+            return cached
+
+        holidays = self.load_holiday_ordinals(holidays_file)
+        # Only sweep names this method generates, <file>.<mtime_ns>.<size>[.ordinals].pkl
+        generated = re.compile(re.escape(holidays_file) + r"\.\d+\.\d+(\.ordinals)?\.pkl")
+        for stale_file in glob.glob(glob.escape(holidays_file) + ".*.pkl"):
+            if stale_file != cache_file and generated.fullmatch(stale_file):
+                try:
+                    os.remove(stale_file)
+                except OSError:
+                    pass
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'wb') as file:
+                pickle.dump(holidays, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception:  # Caching is best effort, e.g. on a read-only directory
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+        return holidays
+
+
     def convert_dt(
             self, 
             from_date : datetime.datetime, 
@@ -55,10 +315,44 @@ class DateUtility:
         :return: The converted datetime in the target timezone
         :rtype: datetime.datetime
         """
-        from_timezone = pytz.timezone(from_date_TZ)
-        to_timezone = pytz.timezone(to_date_TZ)
-        from_date = from_timezone.localize(from_date)
-        return from_date.astimezone(to_timezone)
+        return _convert(from_date, from_date_TZ, to_date_TZ)
+
+
+    def convert_dt_batch(
+            self, 
+            from_dates, 
+            from_date_TZ : str, 
+            to_date_TZ : str
+            ):
+        """
+        Converts a sequence of naive datetimes from one timezone to another in a single vectorized pass.
+        Ambiguous and nonexistent wall times are read as in convert_dt. Requires pandas.
+        :param from_dates: The datetimes to convert
+        :type from_dates: sequence of datetime.datetime
+        :param from_date_TZ: Timezone of the source datetimes
+        :type from_date_TZ: str
+        :param to_date_TZ: Timezone of the target datetimes
+        :type to_date_TZ: str
+        :return: The converted datetimes in the target timezone
+        :rtype: pandas.DatetimeIndex
+        """
+        try:
+            import pandas as pd  # Imported here so plain date arithmetic never pays for pandas
+        except ImportError:
+            raise ImportError("convert_dt_batch requires pandas") from None
+        index = pd.DatetimeIndex(from_dates)
+        converted = index.tz_localize(from_date_TZ, ambiguous="NaT", nonexistent="NaT").tz_convert(to_date_TZ)
+        # Repeated or skipped wall times come back as NaT; convert those few through _convert so
+        # they get the same reading as convert_dt (pandas' DST flag is inverted for zones like Europe/Dublin)
+        unresolved = converted.isna() & ~index.isna()
+        if unresolved.any():
+            filled = pd.DatetimeIndex([
+                _convert(value.to_pydatetime(), from_date_TZ, to_date_TZ).astimezone(datetime.timezone.utc)
+                if missing else None
+                for value, missing in zip(index, unresolved)
+            ]).tz_convert(to_date_TZ)
+            converted = converted.where(~unresolved, filled)
+        return converted
 
 
     def add_dt(
@@ -101,7 +395,7 @@ class DateUtility:
             to_date : datetime.datetime
             ) -> int:
         """
-        Calculates the number of days between two dates.
+        Calculates the number of calendar days between two dates, ignoring the time of day.
         :param from_date: The starting date
         :type from_date: datetime.datetime
         :param to_date: The ending date
@@ -109,7 +403,7 @@ class DateUtility:
         :return: The number of days between the two dates
         :rtype: int
         """
-        return (to_date - from_date).days
+        return (_as_date(to_date) - _as_date(from_date)).days
 
 
     def get_days_exclude_we(
@@ -126,6 +420,7 @@ class DateUtility:
         :return: The number of days between the two dates excluding weekends
         :rtype: int
         """
+        from_date, to_date = _as_date(from_date), _as_date(to_date)
         days = (to_date - from_date).days
         weekends = self.count_weekends(from_date, to_date)
         return days - weekends
@@ -138,20 +433,26 @@ class DateUtility:
             ) -> int:
         """
         Counts the number of weekends (Saturday and Sunday) between two dates.
+        Raw (year, month, day) tuples are also accepted and resolved through the 48-month tables.
         :param from_date: The starting datetime
-        :type from_date: datetime.datetime
+        :type from_date: datetime.datetime or tuple
         :param to_date: The ending datetime
-        :type to_date: datetime.datetime
+        :type to_date: datetime.datetime or tuple
         :return: The number of weekends between the two dates
         :rtype: int
         """
-        weekends = 0
-        current_date = from_date
-        while current_date <= to_date:
-            if current_date.weekday() >= 5:  # Saturday (5) or Sunday (6)
-                weekends += 1
-            current_date += datetime.timedelta(days=1)
-        return weekends
+        from_date, to_date = _as_date(from_date), _as_date(to_date)
+        if isinstance(from_date, tuple):
+            from_number = _day_number(*from_date)
+            n = _day_number(*to_date) - from_number + 1
+            start_wd = (from_number + _CYCLE_START_WEEKDAY) % 7
+        else:
+            n = (to_date - from_date).days + 1
+            start_wd = from_date.weekday()
+        if n <= 0:
+            return 0
+        full_weeks, rem = divmod(n, 7)
+        return full_weeks * 2 + REM_WE[start_wd][rem]
 
 
     def get_days_since_epoch(
@@ -165,8 +466,7 @@ class DateUtility:
         :return: The number of days since the epoch
         :rtype: int
         """
-        epoch = datetime.datetime.utcfromtimestamp(0)
-        return (from_date - epoch).days
+        return from_date.toordinal() - _EPOCH_ORD
 
 
     def is_holiday(
@@ -183,9 +483,7 @@ class DateUtility:
         :return: True if the date is a holiday, False otherwise
         :rtype: bool
         """
-        if timezone in self.holidays and date in self.holidays[timezone]:
-            return True
-        return False
+        return date.toordinal() in self._holiday_ord_set.get(timezone, ())
 
     def get_business_days(
             self, 
@@ -201,13 +499,15 @@ class DateUtility:
         :return: The number of business days between the two dates
         :rtype: int
         """
-        current_date = from_date
-        business_days = 0
-        while current_date <= to_date:
-            if current_date.weekday() < 5 and not self.is_holiday(current_date, "US/Eastern"):
-                business_days += 1
-            current_date += datetime.timedelta(days=1)
-        return business_days
+        from_date, to_date = _as_date(from_date), _as_date(to_date)
+        from_ord = from_date.toordinal()
+        to_ord = to_date.toordinal()
+        n = to_ord - from_ord + 1
+        if n <= 0:
+            return 0
+        holidays = self._business_holiday_ordinals
+        weekday_holidays = bisect_right(holidays, to_ord) - bisect_left(holidays, from_ord)
+        return n - self.count_weekends(from_date, to_date) - weekday_holidays
 
 
 